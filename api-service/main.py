@@ -20,7 +20,8 @@ and business logic across all communication channels.
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import os
 from datetime import datetime
@@ -41,7 +42,9 @@ app = FastAPI(
     description="Case Management System API for In re Ashe B., J24-00478",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson renders response bodies in C, much faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -53,6 +56,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (timeline, report); repeated field names shrink well
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 
 # ============================================================================
 # Middleware
@@ -12,12 +12,24 @@ and ensure consistent behavior across all channels.
 """
 
 import os
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+import httpx
+from typing import List, Dict, Optional, Any, Tuple
+from datetime import date, datetime, timedelta
 from supabase import create_client, Client
 from dataclasses import dataclass
 
 
+# Column projections: fetch only the fields the result dataclasses read,
+# so PostgREST doesn't serialize unused (often large) columns. Only tables
+# whose columns are all in the schema get one - naming a missing column
+# fails the whole query, so the rest keep select("*")
+COMMUNICATION_COLUMNS = (
+    "communication_id,sender,recipient,sent_date,content,"
+    "truthfulness_score,contains_contradiction,contradiction_details"
+)
+HEARING_LIST_COLUMNS = "hearing_id,hearing_date,hearing_type,judge_name"
+
+
 @dataclass
 class CommunicationResult:
     """Result from searching communications"""
@@ -96,6 +108,33 @@ class ASEAGIService:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
 
         self.supabase: Client = create_client(supabase_url, supabase_key)
+        self._use_pooled_session()
+
+    def _use_pooled_session(self) -> None:
+        """
+        Swap the PostgREST session for a long-lived keep-alive pool.
+
+        Every endpoint shares this client, so warm connections (HTTP/2
+        when available) save a TCP + TLS handshake on each request.
+        """
+        old = self.supabase.postgrest.session
+        options = dict(
+            base_url=old.base_url,
+            headers=old.headers,
+            timeout=old.timeout,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=300
+            ),
+        )
+        try:
+            session = httpx.Client(http2=True, **options)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+            session = httpx.Client(**options)
+        self.supabase.postgrest.session = session
+        old.close()
 
     # ========================================================================
     # COMMUNICATIONS
@@ -126,7 +165,7 @@ class ASEAGIService:
         Returns:
             List of communication results
         """
-        db_query = self.supabase.table("communications").select("*")
+        db_query = self.supabase.table("communications").select(COMMUNICATION_COLUMNS)
 
         # Apply filters
         if query:
@@ -169,7 +208,8 @@ class ASEAGIService:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         event_type: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[Tuple[date, int]] = None
     ) -> List[TimelineEvent]:
         """
         Get chronological timeline of case events.
@@ -179,6 +219,8 @@ class ASEAGIService:
             end_date: Filter by date range (ISO format)
             event_type: Filter by event type ('hearing', 'filing', 'incident', etc.)
             limit: Max results (default 100)
+            before: Keyset cursor (event_date, event_id) of the last event on
+                the previous page; returns the events that sort after it
 
         Returns:
             List of timeline events
@@ -192,8 +234,20 @@ class ASEAGIService:
             db_query = db_query.lte("event_date", end_date)
         if event_type:
             db_query = db_query.eq("event_type", event_type)
+        if before:
+            # Keyset pagination on (event_date, event_id), served by the
+            # idx_events_date_id index - no rows are skipped with OFFSET
+            before_date, before_id = before
+            before_date = before_date.isoformat()
+            db_query = db_query.or_(
+                f'event_date.lt."{before_date}",'
+                f'and(event_date.eq."{before_date}",event_id.lt.{before_id})'
+            )
 
-        result = db_query.order("event_date", desc=True).limit(limit).execute()
+        result = db_query.order("event_date", desc=True)\
+            .order("event_id", desc=True)\
+            .limit(limit)\
+            .execute()
 
         # Convert to dataclass
         events = []
@@ -380,7 +434,7 @@ class ASEAGIService:
         """
         end_date = (datetime.now() + timedelta(days=days)).isoformat()
 
-        result = self.supabase.table("hearings").select("*")\
+        result = self.supabase.table("hearings").select(HEARING_LIST_COLUMNS)\
             .gte("hearing_date", datetime.now().isoformat())\
             .lte("hearing_date", end_date)\
             .order("hearing_date", desc=False)\
@@ -414,81 +468,18 @@ class ASEAGIService:
         """
         Generate daily summary report.
 
+        All five sections are built by the daily_report() SQL function
+        (see api_service_functions.sql) in a single round-trip. The report
+        date is this server's local date, not the database's.
+
         Returns:
             Dictionary with report sections
         """
         today = datetime.now().date().isoformat()
-        seven_days = (datetime.now() + timedelta(days=7)).isoformat()
-
-        # Get urgent action items
-        urgent_actions = self.get_action_items(
-            status="pending",
-            priority="urgent",
-            limit=10
-        )
-
-        # Get upcoming deadlines
-        upcoming_actions = self.get_action_items(
-            status="pending",
-            due_soon=True,
-            limit=10
-        )
-
-        # Get upcoming hearings
-        upcoming_hearings = self.get_upcoming_hearings(days=14)
-
-        # Get recent violations
-        recent_violations = self.get_violations(limit=5)
-
-        # Get recent contradictions
-        contradictions = self.search_communications(
-            has_contradictions=True,
-            limit=5
-        )
 
-        return {
-            "date": today,
-            "urgent_actions": [
-                {
-                    "title": item.title,
-                    "priority": item.priority,
-                    "due_date": item.due_date
-                }
-                for item in urgent_actions
-            ],
-            "upcoming_deadlines": [
-                {
-                    "title": item.title,
-                    "due_date": item.due_date,
-                    "status": item.status
-                }
-                for item in upcoming_actions
-            ],
-            "upcoming_hearings": [
-                {
-                    "hearing_date": h["hearing_date"],
-                    "hearing_type": h["hearing_type"],
-                    "judge_name": h.get("judge_name")
-                }
-                for h in upcoming_hearings
-            ],
-            "recent_violations": [
-                {
-                    "type": v.violation_type,
-                    "severity": v.severity,
-                    "description": v.description
-                }
-                for v in recent_violations
-            ],
-            "recent_contradictions": [
-                {
-                    "sender": c.sender,
-                    "date": c.sent_date,
-                    "content_preview": c.content[:100] + "..." if len(c.content) > 100 else c.content
-                }
-                for c in contradictions
-            ]
-        }
+        return self.supabase.rpc(
+            "daily_report", {"report_date": today}
+        ).execute().data
 
     # ========================================================================
     # MOTION GENERATION (Placeholder)
@@ -76,47 +76,50 @@ def call_api(endpoint: str, method: str = "GET", json_data: dict = None, params:
         }
 
 
+def format_result_item(item: dict) -> str:
+    """Format a single result row for a Telegram message"""
+    if "title" in item:
+        due = f" (Due: {item['due_date']})" if "due_date" in item else ""
+        priority = f" [{item['priority'].upper()}]" if "priority" in item else ""
+        return f"{item['title']}{due}{priority}"
+
+    if "type" in item and "date" in item:
+        return f"{item['date']} - {item['type']}: {item.get('title', 'Event')}"
+
+    if "from" in item:
+        flag = " ⚠️ CONTRADICTION" if item.get("has_contradictions") else ""
+        return (
+            f"{item['from']} → {item['to']} ({item['date'][:10]}){flag}"
+            f"\n   {item.get('content', '')[:100]}"
+        )
+
+    return str(item)
+
+
 def format_response(response: dict) -> str:
     """Format API response for Telegram message"""
     if not response.get("success"):
         return f"❌ Error: {response.get('error', 'Unknown error')}"
 
-    message = f"✅ {response['message']}\n\n"
+    # Collect pieces and join once rather than growing a string with +=
+    parts = [f"✅ {response['message']}\n\n"]
 
     # Add data if present
     data = response.get("data", {})
 
     if "results" in data and data["results"]:
-        message += "Results:\n"
-        for i, item in enumerate(data["results"][:10], 1):  # Limit to 10 items
-            message += f"\n{i}. "
-
-            # Format based on item type
-            if "title" in item:
-                message += f"{item['title']}"
-                if "due_date" in item:
-                    message += f" (Due: {item['due_date']})"
-                if "priority" in item:
-                    message += f" [{item['priority'].upper()}]"
-
-            elif "type" in item and "date" in item:
-                message += f"{item['date']} - {item['type']}: {item.get('title', 'Event')}"
-
-            elif "from" in item:
-                message += f"{item['from']} → {item['to']} ({item['date'][:10]})"
-                if item.get("has_contradictions"):
-                    message += " ⚠️ CONTRADICTION"
-                message += f"\n   {item.get('content', '')[:100]}"
-
-            else:
-                message += str(item)
+        parts.append("Results:\n")
+        parts.extend(
+            f"\n{i}. {format_result_item(item)}"
+            for i, item in enumerate(data["results"][:10], 1)  # Limit to 10 items
+        )
 
         # Show if there are more results
         total = data.get("count", len(data["results"]))
         if total > 10:
-            message += f"\n\n... and {total - 10} more"
+            parts.append(f"\n\n... and {total - 10} more")
 
-    return message
+    return "".join(parts)
 
 
 # ============================================================================
@@ -276,49 +279,46 @@ async def report_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if response.get("success"):
         data = response.get("data", {})
 
-        report = f"📊 **Daily Report - {data.get('date')}**\n\n"
+        parts = [f"📊 **Daily Report - {data.get('date')}**\n\n"]
 
         # Urgent actions
         urgent = data.get("urgent_actions", [])
         if urgent:
-            report += f"🚨 **{len(urgent)} Urgent Actions:**\n"
-            for item in urgent[:5]:
-                report += f"  • {item['title']} (Due: {item['due_date']})\n"
-            report += "\n"
+            parts.append(f"🚨 **{len(urgent)} Urgent Actions:**\n")
+            parts.extend(f"  • {item['title']} (Due: {item['due_date']})\n" for item in urgent[:5])
+            parts.append("\n")
 
         # Upcoming deadlines
         deadlines = data.get("upcoming_deadlines", [])
         if deadlines:
-            report += f"⚠️ **{len(deadlines)} Upcoming Deadlines:**\n"
-            for item in deadlines[:5]:
-                report += f"  • {item['title']} (Due: {item['due_date']})\n"
-            report += "\n"
+            parts.append(f"⚠️ **{len(deadlines)} Upcoming Deadlines:**\n")
+            parts.extend(f"  • {item['title']} (Due: {item['due_date']})\n" for item in deadlines[:5])
+            parts.append("\n")
 
         # Upcoming hearings
         hearings = data.get("upcoming_hearings", [])
         if hearings:
-            report += f"📅 **{len(hearings)} Upcoming Hearings:**\n"
-            for item in hearings[:3]:
-                report += f"  • {item['hearing_date']} - {item['hearing_type']}\n"
-            report += "\n"
+            parts.append(f"📅 **{len(hearings)} Upcoming Hearings:**\n")
+            parts.extend(f"  • {item['hearing_date']} - {item['hearing_type']}\n" for item in hearings[:3])
+            parts.append("\n")
 
         # Recent violations
         violations = data.get("recent_violations", [])
         if violations:
-            report += f"⚖️ **{len(violations)} Recent Violations:**\n"
-            for item in violations[:3]:
-                report += f"  • [{item['severity'].upper()}] {item['type']}\n"
-            report += "\n"
+            parts.append(f"⚖️ **{len(violations)} Recent Violations:**\n")
+            parts.extend(f"  • [{item['severity'].upper()}] {item['type']}\n" for item in violations[:3])
+            parts.append("\n")
 
         # Contradictions
         contradictions = data.get("recent_contradictions", [])
         if contradictions:
-            report += f"⚠️ **{len(contradictions)} Recent Contradictions:**\n"
-            for item in contradictions[:3]:
-                report += f"  • {item['sender']} ({item['date'][:10]})\n"
+            parts.append(f"⚠️ **{len(contradictions)} Recent Contradictions:**\n")
+            parts.extend(f"  • {item['sender']} ({item['date'][:10]})\n" for item in contradictions[:3])
 
         if not any([urgent, deadlines, hearings, violations, contradictions]):
-            report += "✅ All clear - no urgent items"
+            parts.append("✅ All clear - no urgent items")
+
+        report = "".join(parts)
 
         await update.message.reply_text(report)
     else:
@@ -370,19 +370,18 @@ async def motion_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if response.get("success"):
         data = response.get("data", {})
-        message = f"📝 **Motion for {motion_type.title()}**\n\n"
-        message += f"Issue: {issue}\n\n"
+        parts = [f"📝 **Motion for {motion_type.title()}**\n\n", f"Issue: {issue}\n\n"]
 
         structure = data.get("structure", {})
-        message += "Structure:\n"
-        for key, value in structure.items():
-            message += f"  • {key.replace('_', ' ').title()}\n"
+        parts.append("Structure:\n")
+        parts.extend(f"  • {key.replace('_', ' ').title()}\n" for key in structure)
 
         next_steps = data.get("next_steps", [])
         if next_steps:
-            message += "\nNext Steps:\n"
-            for step in next_steps:
-                message += f"  • {step}\n"
+            parts.append("\nNext Steps:\n")
+            parts.extend(f"  • {step}\n" for step in next_steps)
+
+        message = "".join(parts)
 
         await update.message.reply_text(message)
     else:
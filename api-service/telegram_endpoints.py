@@ -10,16 +10,26 @@ These endpoints provide simple, fast access to ASEAGI data for:
 - Automated alerts via n8n
 
 All endpoints use the shared service layer (services.py) to ensure
-consistency with MCP servers and other channels.
+consistency with MCP servers and other channels. The service layer is
+synchronous, so database-backed calls run in the threadpool to keep the
+event loop free for concurrent requests.
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, List
-from datetime import datetime
-from pydantic import BaseModel
+from datetime import date, datetime, timedelta
+from functools import wraps
+from pydantic import BaseModel, Field
+from cachetools import TTLCache
+import redis.asyncio as aioredis
+import logging
+import os
 
 from services import ASEAGIService
 
+logger = logging.getLogger(__name__)
+
 
 # Create router for Telegram endpoints
 router = APIRouter(prefix="/telegram", tags=["telegram"])
@@ -27,6 +37,59 @@ router = APIRouter(prefix="/telegram", tags=["telegram"])
 # Initialize shared service
 service = ASEAGIService()
 
+# Short-lived response cache for read-only endpoints; repeated bot commands
+# within the window are answered without touching Supabase
+RESPONSE_CACHE_TTL = 30
+_response_cache = TTLCache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+
+# Optional shared second level (Redis) so all workers/replicas reuse each
+# other's responses; the in-process cache stays in front of it. Short socket
+# timeouts make an unreachable Redis fall through to Supabase quickly
+# instead of stalling each request for the OS TCP timeout
+REDIS_TIMEOUT = 0.5
+_redis = (
+    aioredis.from_url(
+        os.environ["REDIS_URL"],
+        password=os.environ.get("REDIS_PASSWORD") or None,
+        socket_connect_timeout=REDIS_TIMEOUT,
+        socket_timeout=REDIS_TIMEOUT
+    )
+    if os.environ.get("REDIS_URL") else None
+)
+
+
+def cached_response(func):
+    """Cache an endpoint's response keyed on its name and query parameters"""
+    @wraps(func)
+    async def wrapper(**kwargs):
+        params = tuple(sorted(kwargs.items()))
+        key = (func.__name__, params)
+        if key in _response_cache:
+            return _response_cache[key]
+
+        redis_key = f"telegram:{func.__name__}:{params!r}"
+        if _redis is not None:
+            try:
+                cached = await _redis.get(redis_key)
+            except aioredis.RedisError as e:
+                logger.warning(f"Redis cache read failed: {e}")
+                cached = None
+            if cached:
+                response = TelegramResponse.model_validate_json(cached)
+                _response_cache[key] = response
+                return response
+
+        response = await func(**kwargs)
+        _response_cache[key] = response
+
+        if _redis is not None:
+            try:
+                await _redis.set(redis_key, response.model_dump_json(), ex=RESPONSE_CACHE_TTL)
+            except aioredis.RedisError as e:
+                logger.warning(f"Redis cache write failed: {e}")
+        return response
+    return wrapper
+
 
 # ============================================================================
 # Request/Response Models
@@ -40,11 +103,18 @@ class TelegramResponse(BaseModel):
     error: Optional[str] = None
 
 
+# Largest page any endpoint will buffer into a single response
+MAX_RESULTS = 100
+
+# Events per /timeline page
+TIMELINE_PAGE_SIZE = 50
+
+
 class SearchRequest(BaseModel):
     """Request for search operations"""
     query: str
     sender: Optional[str] = None
-    limit: int = 10
+    limit: int = Field(10, ge=1, le=MAX_RESULTS)
 
 
 class TimelineRequest(BaseModel):
@@ -70,7 +140,8 @@ async def search_communications(request: SearchRequest):
         /search Cal OES 2-925
     """
     try:
-        results = service.search_communications(
+        results = await run_in_threadpool(
+            service.search_communications,
             query=request.query,
             sender=request.sender,
             limit=request.limit
@@ -116,9 +187,11 @@ async def search_communications(request: SearchRequest):
 # ============================================================================
 
 @router.get("/timeline", response_model=TelegramResponse)
+@cached_response
 async def get_timeline(
     days: int = Query(30, description="Number of days to look back"),
-    event_type: Optional[str] = Query(None, description="Filter by event type")
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    before: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
     """
     Get case timeline.
@@ -129,15 +202,32 @@ async def get_timeline(
         /timeline
         /timeline 60
         /timeline hearing
+
+    Pages are keyset-paginated: pass the returned next_cursor as `before`
+    to fetch the following page.
     """
+    cursor = None
+    if before:
+        before_date, _, before_id = before.rpartition("|")
+        if not before_id.isdigit():
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # event_date is a DATE; parsing it also keeps arbitrary text out of
+        # the PostgREST filter the cursor is interpolated into
+        try:
+            cursor = (date.fromisoformat(before_date), int(before_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     try:
         # Calculate date range
-        start_date = (datetime.now() - __import__('datetime').timedelta(days=days)).isoformat()
+        start_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-        results = service.get_timeline(
+        results = await run_in_threadpool(
+            service.get_timeline,
             start_date=start_date,
             event_type=event_type,
-            limit=50
+            limit=TIMELINE_PAGE_SIZE,
+            before=cursor
         )
 
         if not results:
@@ -160,13 +250,21 @@ async def get_timeline(
 
         message = f"Timeline: {len(results)} events in last {days} days"
 
+        # A full page means there may be more; hand back a cursor for it
+        last = results[-1]
+        next_cursor = (
+            f"{last.event_date}|{last.event_id}"
+            if len(results) == TIMELINE_PAGE_SIZE else None
+        )
+
         return TelegramResponse(
             success=True,
             message=message,
             data={
                 "count": len(results),
                 "days": days,
-                "results": formatted_results
+                "results": formatted_results,
+                "next_cursor": next_cursor
             }
         )
 
@@ -179,6 +277,7 @@ async def get_timeline(
 # ============================================================================
 
 @router.get("/actions", response_model=TelegramResponse)
+@cached_response
 async def get_action_items(
     priority: Optional[str] = Query(None, description="Filter by priority"),
     due_soon: bool = Query(False, description="Show only items due within 7 days")
@@ -194,7 +293,8 @@ async def get_action_items(
         /actions due_soon
     """
     try:
-        results = service.get_action_items(
+        results = await run_in_threadpool(
+            service.get_action_items,
             status="pending",
             priority=priority,
             due_soon=due_soon,
@@ -244,6 +344,7 @@ async def get_action_items(
 # ============================================================================
 
 @router.get("/violations", response_model=TelegramResponse)
+@cached_response
 async def get_violations(
     severity: Optional[str] = Query(None, description="Filter by severity"),
     violation_type: Optional[str] = Query(None, description="Filter by type")
@@ -259,7 +360,8 @@ async def get_violations(
         /violations perjury
     """
     try:
-        results = service.get_violations(
+        results = await run_in_threadpool(
+            service.get_violations,
             severity=severity,
             violation_type=violation_type,
             limit=20
@@ -308,6 +410,7 @@ async def get_violations(
 # ============================================================================
 
 @router.get("/deadline", response_model=TelegramResponse)
+@cached_response
 async def get_deadlines():
     """
     Get upcoming deadlines (next 7 days).
@@ -315,7 +418,8 @@ async def get_deadlines():
     Telegram usage: /deadline
     """
     try:
-        results = service.get_action_items(
+        results = await run_in_threadpool(
+            service.get_action_items,
             status="pending",
             due_soon=True,
             limit=20
@@ -329,6 +433,7 @@ async def get_deadlines():
             )
 
         # Format results sorted by due date
+        today = datetime.now().date()
         formatted_results = []
         for item in sorted(results, key=lambda x: x.due_date or "9999-99-99"):
             formatted_results.append({
@@ -336,8 +441,7 @@ async def get_deadlines():
                 "due_date": item.due_date,
                 "priority": item.priority,
                 "days_until_due": (
-                    (__import__('datetime').datetime.fromisoformat(item.due_date).date() -
-                     datetime.now().date()).days
+                    (datetime.fromisoformat(item.due_date).date() - today).days
                     if item.due_date else None
                 )
             })
@@ -362,6 +466,7 @@ async def get_deadlines():
 # ============================================================================
 
 @router.get("/report", response_model=TelegramResponse)
+@cached_response
 async def daily_report():
     """
     Get daily summary report.
@@ -369,7 +474,7 @@ async def daily_report():
     Telegram usage: /report
     """
     try:
-        report = service.generate_daily_report()
+        report = await run_in_threadpool(service.generate_daily_report)
 
         # Build summary message
         urgent_count = len(report["urgent_actions"])
@@ -407,6 +512,7 @@ async def daily_report():
 # ============================================================================
 
 @router.get("/hearing", response_model=TelegramResponse)
+@cached_response
 async def get_hearing_info(
     hearing_id: Optional[int] = Query(None, description="Specific hearing ID"),
     days: int = Query(30, description="Days to look ahead")
@@ -423,7 +529,7 @@ async def get_hearing_info(
     try:
         if hearing_id:
             # Get specific hearing
-            hearing = service.get_hearing_details(hearing_id)
+            hearing = await run_in_threadpool(service.get_hearing_details, hearing_id)
             if not hearing:
                 return TelegramResponse(
                     success=False,
@@ -438,7 +544,7 @@ async def get_hearing_info(
             )
         else:
             # Get upcoming hearings
-            hearings = service.get_upcoming_hearings(days=days)
+            hearings = await run_in_threadpool(service.get_upcoming_hearings, days=days)
 
             if not hearings:
                 return TelegramResponse(
@@ -0,0 +1,108 @@
+-- ============================================================================
+-- ASEAGI API SERVICE FUNCTIONS
+-- Purpose: Server-side queries for api-service/services.py (Telegram, n8n)
+-- Each function replaces several PostgREST round-trips with one RPC call
+-- ============================================================================
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Timeline keyset pagination: ORDER BY event_date DESC, event_id DESC with a
+-- (event_date, event_id) < cursor predicate walks this index directly
+CREATE INDEX IF NOT EXISTS idx_events_date_id
+    ON events (event_date DESC, event_id DESC);
+
+-- ============================================================================
+-- FUNCTIONS
+-- ============================================================================
+
+-- Function: Daily summary report, all sections in one call
+-- Called as: supabase.rpc('daily_report', {'report_date': 'YYYY-MM-DD'})
+-- report_date is the caller's local date; CURRENT_DATE would use the
+-- database timezone instead. hearing_date and due_date are DATE columns,
+-- so the windows compare dates rather than NOW() timestamps (which would
+-- drop today's hearings once promoted to midnight).
+-- Returns the same shape ASEAGIService.generate_daily_report always has:
+--   date, urgent_actions, upcoming_deadlines, upcoming_hearings,
+--   recent_violations, recent_contradictions
+DROP FUNCTION IF EXISTS daily_report();
+
+CREATE OR REPLACE FUNCTION daily_report(report_date DATE DEFAULT CURRENT_DATE)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'date', report_date::TEXT,
+        'urgent_actions', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'title', title, 'priority', priority, 'due_date', due_date
+            ) ORDER BY due_date)
+            FROM (
+                SELECT title, priority, due_date
+                FROM action_items
+                WHERE status = 'pending' AND priority = 'urgent'
+                ORDER BY due_date
+                LIMIT 10
+            ) a
+        ), '[]'::jsonb),
+        'upcoming_deadlines', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'title', title, 'due_date', due_date, 'status', status
+            ) ORDER BY due_date)
+            FROM (
+                SELECT title, due_date, status
+                FROM action_items
+                WHERE status = 'pending' AND due_date <= report_date + 7
+                ORDER BY due_date
+                LIMIT 10
+            ) d
+        ), '[]'::jsonb),
+        'upcoming_hearings', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'hearing_date', hearing_date,
+                'hearing_type', hearing_type,
+                'judge_name', judge_name
+            ) ORDER BY hearing_date)
+            FROM hearings
+            WHERE hearing_date BETWEEN report_date AND report_date + 14
+        ), '[]'::jsonb),
+        -- violations columns as defined in tiered_analysis_schema.sql
+        'recent_violations', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'type', violation_type,
+                'severity', violation_severity,
+                'description', violation_description
+            ) ORDER BY detected_at DESC)
+            FROM (
+                SELECT violation_type, violation_severity, violation_description, detected_at
+                FROM violations
+                ORDER BY detected_at DESC
+                LIMIT 5
+            ) v
+        ), '[]'::jsonb),
+        'recent_contradictions', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'sender', sender,
+                'date', sent_date,
+                'content_preview', CASE
+                    WHEN length(content) > 100 THEN left(content, 100) || '...'
+                    ELSE content
+                END
+            ) ORDER BY sent_date DESC)
+            FROM (
+                SELECT sender, sent_date, content
+                FROM communications
+                WHERE contains_contradiction = TRUE
+                ORDER BY sent_date DESC
+                LIMIT 5
+            ) c
+        ), '[]'::jsonb)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+/*
+Run this SQL in the Supabase SQL Editor before deploying api-service.
+Functions are exposed to ASEAGIService through PostgREST RPC.
+*/
@@ -9,6 +9,8 @@ import os
 from datetime import datetime
 import pandas as pd
 from collections import Counter
+import heapq
+from operator import itemgetter
 
 try:
     from supabase import create_client
@@ -304,7 +306,7 @@ def main():
             st.success(f"🔥 **{len(smoking_gun_docs)} documents contain smoking guns!**")
 
             with st.expander(f"View {len(smoking_gun_docs)} Smoking Gun Documents"):
-                for doc in sorted(smoking_gun_docs, key=lambda x: x['Relevancy'], reverse=True):
+                for doc in sorted(smoking_gun_docs, key=itemgetter('Relevancy'), reverse=True):
                     st.write(f"**[{doc['Relevancy']:03d}]** {doc['Title']} - 🔥 {doc['Smoking Guns Count']} smoking gun(s)")
         else:
             st.info("No smoking guns identified yet.")
@@ -336,21 +338,21 @@ def main():
 
         with col1:
             st.write("**W&I §388 (Reopen Dependency)**")
-            top_w388 = sorted(chart_data, key=lambda x: x['W&I §388'], reverse=True)[:5]
+            top_w388 = heapq.nlargest(5, chart_data, key=itemgetter('W&I §388'))
             for i, doc in enumerate(top_w388, 1):
                 if doc['W&I §388'] > 0:
                     st.write(f"{i}. [{doc['W&I §388']:03d}/100] {doc['Title'][:35]}")
 
         with col2:
             st.write("**CCP §473(d) (Void Orders)**")
-            top_ccp = sorted(chart_data, key=lambda x: x['CCP §473'], reverse=True)[:5]
+            top_ccp = heapq.nlargest(5, chart_data, key=itemgetter('CCP §473'))
             for i, doc in enumerate(top_ccp, 1):
                 if doc['CCP §473'] > 0:
                     st.write(f"{i}. [{doc['CCP §473']:03d}/100] {doc['Title'][:35]}")
 
         with col3:
             st.write("**Criminal (Perjury/Fraud)**")
-            top_crim = sorted(chart_data, key=lambda x: x['Criminal'], reverse=True)[:5]
+            top_crim = heapq.nlargest(5, chart_data, key=itemgetter('Criminal'))
             for i, doc in enumerate(top_crim, 1):
                 if doc['Criminal'] > 0:
                     st.write(f"{i}. [{doc['Criminal']:03d}/100] {doc['Title'][:35]}")
@@ -29,10 +29,8 @@ class SchemaValidator:
             return self.schema_cache[table_name]
 
         try:
-            # Get table columns by querying with limit 0
-            result = self.supabase.table(table_name).select("*").limit(0).execute()
-
-            # Also get a sample row to see actual data structure
+            # A single sample row exposes the column names; a limit(0)
+            # query returns no rows and so tells us nothing extra
             sample = self.supabase.table(table_name).select("*").limit(1).execute()
 
             columns = []
@@ -56,6 +54,7 @@ class SchemaValidator:
         """Validate that queried columns exist in table schema"""
         schema = self.fetch_table_schema(table_name)
         actual_columns = schema.get("columns", [])
+        known_columns = set(actual_columns)
 
         missing_columns = []
         valid_columns = []
@@ -65,7 +64,7 @@ class SchemaValidator:
                 valid_columns.append(col)
                 continue
 
-            if col not in actual_columns:
+            if col not in known_columns:
                 missing_columns.append(col)
             else:
                 valid_columns.append(col)
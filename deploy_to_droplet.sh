@@ -35,9 +35,8 @@ ssh ${DROPLET_USER}@${DROPLET_IP} << 'ENDSSH'
 
     # Pull latest changes
     echo "📥 Pulling latest changes..."
-    git fetch origin
-    git checkout claude/api-vs-web-clarification-011CUuqk9SwXoeKNSzwfQq68
-    git pull origin claude/api-vs-web-clarification-011CUuqk9SwXoeKNSzwfQq68
+    git fetch --depth=1 origin claude/api-vs-web-clarification-011CUuqk9SwXoeKNSzwfQq68
+    git checkout -B claude/api-vs-web-clarification-011CUuqk9SwXoeKNSzwfQq68 FETCH_HEAD
     echo "✓ Code updated"
 
     # Stop existing containers
@@ -72,13 +71,13 @@ ssh ${DROPLET_USER}@${DROPLET_IP} << 'ENDSSH'
     # Check health
     echo ""
     echo "🏥 Health Checks:"
-    for port in 8501 8502 8503 8504 8505; do
-        if curl -sf http://localhost:${port}/_stcore/health > /dev/null 2>&1; then
-            echo "  ✓ Port ${port}: HEALTHY"
+    # Probe all ports in parallel; sort restores port order in the output
+    printf '%s\n' 8501 8502 8503 8504 8505 | xargs -P5 -I{} sh -c '
+        if curl -sf --connect-timeout 2 --max-time 5 http://localhost:{}/_stcore/health > /dev/null 2>&1; then
+            echo "  ✓ Port {}: HEALTHY"
         else
-            echo "  ⚠️  Port ${port}: INITIALIZING (check logs if this persists)"
-        fi
-    done
+            echo "  ⚠️  Port {}: INITIALIZING (check logs if this persists)"
+        fi' | sort
 
     # Show logs for any unhealthy containers
     echo ""
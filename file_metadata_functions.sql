@@ -0,0 +1,208 @@
+-- ============================================================================
+-- FILE METADATA DASHBOARD FUNCTIONS
+-- Purpose: Server-side aggregates for supabase_dashboard.py
+-- Each function replaces several PostgREST round-trips (or a full-table
+-- download) with a single RPC call
+-- ============================================================================
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Partial covering index for find_duplicates: lets the GROUP BY content_hash
+-- run as an index-only scan without visiting the heap
+CREATE INDEX IF NOT EXISTS idx_file_metadata_hash
+    ON file_metadata (content_hash)
+    INCLUDE (file_id, filename, file_path, size_mb)
+    WHERE content_hash IS NOT NULL;
+
+-- Composite indexes for the list views: equality filter plus ORDER BY
+-- modified_date DESC LIMIT n becomes a bounded index range scan
+CREATE INDEX IF NOT EXISTS idx_file_metadata_dept_modified
+    ON file_metadata (dept_code, modified_date DESC);
+CREATE INDEX IF NOT EXISTS idx_file_metadata_para_modified
+    ON file_metadata (para_category, modified_date DESC);
+-- Recent Files: range on modified_date, newest first
+CREATE INDEX IF NOT EXISTS idx_file_metadata_modified
+    ON file_metadata (modified_date DESC);
+
+-- Full-text search column for the dashboard's Text Search mode. A leading
+-- wildcard ILIKE '%term%' cannot use a B-tree index; the GIN index can.
+ALTER TABLE file_metadata
+    ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+    GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(search_text, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_file_metadata_search_tsv
+    ON file_metadata USING gin(search_tsv);
+
+-- ============================================================================
+-- FUNCTIONS
+-- ============================================================================
+
+-- Function: File counts by PARA category, naming compliance and total size, in one scan
+-- Called as: supabase.rpc('get_para_stats')
+CREATE OR REPLACE FUNCTION get_para_stats()
+RETURNS JSONB AS $$
+    WITH counts AS (
+        SELECT
+            para_category,
+            COUNT(*) AS files,
+            COUNT(*) FILTER (WHERE naming_compliant) AS compliant,
+            SUM(size_mb) AS size_mb
+        FROM file_metadata
+        GROUP BY para_category
+    )
+    SELECT jsonb_build_object(
+        'total', COALESCE(SUM(files), 0),
+        'compliant', COALESCE(SUM(compliant), 0),
+        'size_mb', COALESCE(SUM(size_mb), 0),
+        'para', COALESCE(
+            jsonb_object_agg(para_category, files) FILTER (WHERE para_category IS NOT NULL),
+            '{}'::jsonb
+        )
+    )
+    FROM counts;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Top N departments by file count
+-- Called as: supabase.rpc('dept_top_n', {'n': 20})
+CREATE OR REPLACE FUNCTION dept_top_n(n INT DEFAULT 20)
+RETURNS TABLE(label TEXT, cnt BIGINT) AS $$
+    SELECT
+        COALESCE(dept_code, 'Unknown') || ' - ' || COALESCE(dept_name, '') AS label,
+        COUNT(*) AS cnt
+    FROM file_metadata
+    GROUP BY dept_code, dept_name
+    ORDER BY cnt DESC
+    LIMIT n;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Top N file type categories by file count
+-- Called as: supabase.rpc('filetype_top_n', {'n': 10})
+CREATE OR REPLACE FUNCTION filetype_top_n(n INT DEFAULT 10)
+RETURNS TABLE(label TEXT, cnt BIGINT) AS $$
+    SELECT
+        COALESCE(file_type_category, 'Unknown') AS label,
+        COUNT(*) AS cnt
+    FROM file_metadata
+    GROUP BY file_type_category
+    ORDER BY cnt DESC
+    LIMIT n;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Departments for the dashboard selector, busiest first
+-- Called as: supabase.rpc('list_departments')
+CREATE OR REPLACE FUNCTION list_departments()
+RETURNS TABLE(dept_code TEXT, dept_name TEXT) AS $$
+    SELECT dept_code, MAX(dept_name) AS dept_name
+    FROM file_metadata
+    WHERE dept_code IS NOT NULL
+    GROUP BY dept_code
+    ORDER BY COUNT(*) DESC, dept_code;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Duplicate files grouped by content hash, largest groups first
+-- Called as: supabase.rpc('find_duplicates')
+-- Only the first max_groups groups are returned; the total_* columns carry
+-- the overall figures across every duplicate group (window aggregates are
+-- computed before LIMIT)
+DROP FUNCTION IF EXISTS find_duplicates(INT);
+
+CREATE OR REPLACE FUNCTION find_duplicates(max_groups INT DEFAULT 500)
+RETURNS TABLE(
+    hash TEXT,
+    count BIGINT,
+    total_size_mb DOUBLE PRECISION,
+    wasted_mb DOUBLE PRECISION,
+    files JSONB,
+    total_groups BIGINT,
+    total_files BIGINT,
+    total_wasted_mb DOUBLE PRECISION
+) AS $$
+    SELECT
+        content_hash AS hash,
+        COUNT(*) AS count,
+        COALESCE(SUM(size_mb), 0)::DOUBLE PRECISION AS total_size_mb,
+        -- Space reclaimed by keeping one copy
+        (COALESCE(SUM(size_mb), 0) * (COUNT(*) - 1) / COUNT(*))::DOUBLE PRECISION AS wasted_mb,
+        jsonb_agg(jsonb_build_object(
+            'file_id', file_id,
+            'filename', filename,
+            'file_path', file_path,
+            'size_mb', COALESCE(size_mb, 0)
+        )) AS files,
+        COUNT(*) OVER () AS total_groups,
+        SUM(COUNT(*)) OVER ()::BIGINT AS total_files,
+        SUM(COALESCE(SUM(size_mb), 0) * (COUNT(*) - 1) / COUNT(*)) OVER ()::DOUBLE PRECISION AS total_wasted_mb
+    FROM file_metadata
+    WHERE content_hash IS NOT NULL
+    GROUP BY content_hash
+    HAVING COUNT(*) > 1
+    ORDER BY total_size_mb DESC
+    LIMIT max_groups;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- MATERIALIZED VIEWS
+-- ============================================================================
+
+-- Quick Stats header: one precomputed row, refreshed every 5 minutes by
+-- pg_cron, so the dashboard reads it with a single-row select
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_file_stats AS
+    SELECT
+        1 AS id,
+        (stats->>'total')::BIGINT AS total,
+        (stats->>'compliant')::BIGINT AS compliant,
+        (stats->>'size_mb')::DOUBLE PRECISION AS size_mb,
+        stats->'para' AS para
+    FROM get_para_stats() AS stats;
+
+-- REFRESH ... CONCURRENTLY requires a unique index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_file_stats_id ON mv_file_stats (id);
+
+GRANT SELECT ON mv_file_stats TO anon, authenticated;
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+SELECT cron.schedule(
+    'refresh-mv-file-stats',
+    '*/5 * * * *',
+    'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_file_stats'
+);
+
+-- Function: Refresh mv_file_stats on demand (dashboard "Refresh stats" button)
+-- Called as: supabase.rpc('refresh_file_stats')
+-- SECURITY DEFINER because REFRESH requires ownership of the view
+CREATE OR REPLACE FUNCTION refresh_file_stats()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_file_stats;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+GRANT EXECUTE ON FUNCTION refresh_file_stats() TO anon, authenticated;
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+/*
+Run this SQL in the Supabase SQL Editor before deploying supabase_dashboard.py.
+Functions are exposed to the dashboard through PostgREST RPC.
+
+pg_cron must be enabled for the project (Database > Extensions) for the
+mv_file_stats refresh job. To refresh by hand after a bulk import:
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_file_stats;
+or use the dashboard's "Refresh stats" button, which calls
+refresh_file_stats().
+
+find_duplicates depends on idx_file_metadata_hash. To confirm the planner
+uses it (run VACUUM ANALYZE file_metadata first so the visibility map is
+current):
+    EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM find_duplicates();
+should show an Index Only Scan on idx_file_metadata_hash with
+"Heap Fetches: 0".
+
+The Department, PARA Category and Recent Files views should likewise show
+an Index Scan on the matching idx_file_metadata_*_modified index (no Sort
+node) in EXPLAIN output.
+*/
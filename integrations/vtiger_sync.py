@@ -5,6 +5,8 @@ Syncs bugs and tickets to Vtiger CRM
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 import time
 from typing import Dict, Optional, List
@@ -32,6 +34,20 @@ class VtigerIntegration:
         self.user_id = None
         self.session_expires = 0
         
+        # Reuse one keep-alive connection pool for every webservice call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._http.close()
+        
     def authenticate(self) -> bool:
         """
         Authenticate with Vtiger API
@@ -59,7 +75,7 @@ class VtigerIntegration:
             }
             
             print(f"🔐 Getting challenge token from {self.url}...")
-            response = requests.get(challenge_url, params=challenge_params, timeout=10)
+            response = self._http.get(challenge_url, params=challenge_params, timeout=10)
             response.raise_for_status()
             
             challenge_data = response.json()
@@ -81,7 +97,7 @@ class VtigerIntegration:
             }
             
             print(f"🔑 Logging in as {self.username}...")
-            response = requests.post(challenge_url, data=login_params, timeout=10)
+            response = self._http.post(challenge_url, data=login_params, timeout=10)
             response.raise_for_status()
             
             login_data = response.json()
@@ -150,7 +166,7 @@ class VtigerIntegration:
             }
             
             print(f"📝 Creating Vtiger ticket: {ticket_data['ticket_title']}")
-            response = requests.post(url, data=params, timeout=10)
+            response = self._http.post(url, data=params, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -184,7 +200,7 @@ class VtigerIntegration:
                 'element': str(updates).replace("'", '"')
             }
             
-            response = requests.post(url, data=params, timeout=10)
+            response = self._http.post(url, data=params, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -207,7 +223,7 @@ class VtigerIntegration:
                 'query': query
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -234,7 +250,7 @@ class VtigerIntegration:
                 'id': ticket_id
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self._http.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -99,23 +99,26 @@ class PromoTracker:
         print("💳 PROMOTIONAL CREDIT TRACKER")
         print("=" * 70)
 
+        current_balance = stats['current_balance']
+        percent = stats['percent_used']
+        days_remaining = stats['days_remaining']
+
         # Current Status
-        print(f"\n💰 Current Balance:     ${stats['current_balance']:>8.2f}")
+        print(f"\n💰 Current Balance:     ${current_balance:>8.2f}")
         print(f"📊 Initial Credit:      ${stats['initial_credit']:>8.2f}")
         print(f"💸 Total Spent:         ${stats['total_spent']:>8.2f}")
-        print(f"📈 Percent Used:        {stats['percent_used']:>8.1f}%")
+        print(f"📈 Percent Used:        {percent:>8.1f}%")
 
         # Usage Rate
         print(f"\n⏱️  Days Elapsed:        {stats['days_elapsed']:>8} days")
         print(f"🔥 Daily Burn Rate:     ${stats['daily_burn_rate']:>8.2f}/day")
-        print(f"📅 Days Remaining:      {stats['days_remaining']:>8.0f} days (~{stats['days_remaining']/30:.1f} months)")
+        print(f"📅 Days Remaining:      {days_remaining:>8.0f} days (~{days_remaining/30:.1f} months)")
         print(f"🎯 Estimated End:       {stats['estimated_end_date']}")
 
         # Projections
         print(f"\n📊 Monthly Projection:  ${stats['monthly_projection']:>8.2f}/month")
 
         # Progress Bar
-        percent = stats['percent_used']
         bar_length = 50
         filled = int(bar_length * percent / 100)
         bar = "█" * filled + "░" * (bar_length - filled)
@@ -133,9 +136,10 @@ class PromoTracker:
             print("🔴 Status: LOW - Consider upgrading plan")
 
         # Recent Activity
+        recent = self.data["entries"][-5:]
         print("\n" + "-" * 70)
         print("Recent Activity (Last 5 entries):")
-        for entry in self.data["entries"][-5:]:
+        for entry in recent:
             dt = datetime.fromisoformat(entry["timestamp"])
             print(f"\n  {dt.strftime('%Y-%m-%d %H:%M')}")
             print(f"    Balance: ${entry['balance_remaining']:.2f}")
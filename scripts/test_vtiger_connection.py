@@ -25,7 +25,10 @@ def main():
     vtiger = VtigerIntegration()
     
     # Test connection
-    success = vtiger.test_connection()
+    try:
+        success = vtiger.test_connection()
+    finally:
+        vtiger.close()
     
     if success:
         print("\n🎉 All tests passed!")
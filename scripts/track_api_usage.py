@@ -6,8 +6,8 @@ Monitors your Anthropic API usage and costs
 
 import os
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta
-from anthropic import Anthropic
 
 # Pricing (as of 2024)
 PRICING = {
@@ -25,8 +25,14 @@ PRICING = {
     }
 }
 
+# Model order for estimate_cost_batch's model_indices
+PRICING_MODELS = tuple(PRICING)
+
 def get_usage_stats():
     """Get usage statistics from Anthropic API"""
+    # Imported here so the cost estimators don't pay for loading the SDK
+    from anthropic import Anthropic
+
     client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     # Note: Anthropic doesn't have a usage API endpoint yet
@@ -62,30 +68,51 @@ def estimate_cost(input_tokens: int, output_tokens: int, model: str = "claude-so
         "model": model
     }
 
+def estimate_cost_batch(input_tokens, output_tokens, model_indices):
+    """
+    Estimate total cost for many requests at once
+
+    Args:
+        input_tokens: Array of input token counts
+        output_tokens: Array of output token counts
+        model_indices: Array of indexes into PRICING_MODELS
+
+    Returns:
+        np.ndarray: Total cost per request
+    """
+    # Imported here so the rest of the script doesn't pay for loading NumPy
+    import numpy as np
+
+    # Row i holds (input, output) per-token rates for PRICING_MODELS[i]
+    pricing_rates = np.array([[PRICING[m]["input"], PRICING[m]["output"]] for m in PRICING_MODELS])
+    rates = pricing_rates[np.asarray(model_indices)]
+    return np.asarray(input_tokens) * rates[:, 0] + np.asarray(output_tokens) * rates[:, 1]
+
 def format_cost_report(estimates: list):
     """Format a cost report"""
     print("\n💰 Cost Estimate Report")
     print("=" * 70)
 
-    total_input_tokens = sum(e["input_tokens"] for e in estimates)
-    total_output_tokens = sum(e["output_tokens"] for e in estimates)
-    total_cost = sum(e["total_cost"] for e in estimates)
+    # Totals and per-model breakdown in a single pass
+    total_input_tokens = 0
+    total_output_tokens = 0
+    total_cost = 0
+    models = defaultdict(lambda: {"input": 0, "output": 0, "cost": 0})
+    for e in estimates:
+        total_input_tokens += e["input_tokens"]
+        total_output_tokens += e["output_tokens"]
+        total_cost += e["total_cost"]
+
+        stats = models[e["model"]]
+        stats["input"] += e["input_tokens"]
+        stats["output"] += e["output_tokens"]
+        stats["cost"] += e["total_cost"]
 
     print(f"\nTotal Input Tokens:  {total_input_tokens:>12,}")
     print(f"Total Output Tokens: {total_output_tokens:>12,}")
     print(f"\nTotal Cost: ${total_cost:>8.4f}")
     print()
 
-    # Per model breakdown
-    models = {}
-    for e in estimates:
-        model = e["model"]
-        if model not in models:
-            models[model] = {"input": 0, "output": 0, "cost": 0}
-        models[model]["input"] += e["input_tokens"]
-        models[model]["output"] += e["output_tokens"]
-        models[model]["cost"] += e["total_cost"]
-
     print("\nBreakdown by Model:")
     print("-" * 70)
     for model, stats in models.items():
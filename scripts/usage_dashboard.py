@@ -6,9 +6,27 @@ Track costs as you use Claude Code
 
 import os
 import json
+import atexit
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+try:
+    # orjson is a faster drop-in for decoding the usage log, if installed
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Per-token pricing by model family
+PRICING_BY_TYPE = {
+    "sonnet": {"input": 3.00 / 1_000_000, "output": 15.00 / 1_000_000},
+    "opus": {"input": 15.00 / 1_000_000, "output": 75.00 / 1_000_000},
+    "haiku": {"input": 0.25 / 1_000_000, "output": 1.25 / 1_000_000}
+}
+
+# (substring in model name, model family); anything else is billed as sonnet
+MODEL_TYPE_LOOKUP = (("opus", "opus"), ("haiku", "haiku"))
+
 class UsageTracker:
     """Track Claude API usage locally"""
 
@@ -16,27 +34,20 @@ class UsageTracker:
         if log_file is None:
             log_file = Path.home() / ".claude_usage_log.jsonl"
         self.log_file = Path(log_file)
+        # Running totals for the append-only log, so summaries only read new lines
+        self.rollup_file = self.log_file.with_suffix(".rollup.json")
+        self._log_handle = None
 
     def log_request(self, model: str, input_tokens: int, output_tokens: int,
                     task: str = "general", workspace: str = "default"):
         """Log an API request"""
 
-        # Calculate cost
-        pricing = {
-            "sonnet": {"input": 3.00 / 1_000_000, "output": 15.00 / 1_000_000},
-            "opus": {"input": 15.00 / 1_000_000, "output": 75.00 / 1_000_000},
-            "haiku": {"input": 0.25 / 1_000_000, "output": 1.25 / 1_000_000}
-        }
-
-        # Determine model type
-        model_type = "sonnet"
-        if "opus" in model.lower():
-            model_type = "opus"
-        elif "haiku" in model.lower():
-            model_type = "haiku"
+        # Determine model type and calculate cost
+        model_lc = model.lower()
+        model_type = next((t for key, t in MODEL_TYPE_LOOKUP if key in model_lc), "sonnet")
+        pricing = PRICING_BY_TYPE[model_type]
 
-        cost = (input_tokens * pricing[model_type]["input"] +
-                output_tokens * pricing[model_type]["output"])
+        cost = input_tokens * pricing["input"] + output_tokens * pricing["output"]
 
         entry = {
             "timestamp": datetime.now().isoformat(),
@@ -50,58 +61,105 @@ class UsageTracker:
             "workspace": workspace
         }
 
-        # Append to log
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        # Append to log through one line-buffered handle kept open for the session
+        if self._log_handle is None:
+            self._log_handle = open(self.log_file, "a", buffering=1)
+            atexit.register(self.close)
+        self._log_handle.write(json.dumps(entry) + "\n")
 
         return entry
 
+    def close(self):
+        """Close the log file handle if one is open"""
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+
+    def _load_rollup(self) -> dict:
+        """Load saved running totals, or start fresh if missing or stale"""
+        fresh = {"last_offset": 0, "total_cost": 0, "total_tokens": 0,
+                 "requests": 0, "by_task": {}, "by_model": {}}
+        try:
+            with open(self.rollup_file, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return fresh
+
+        # Log was truncated or replaced since the rollup was written
+        if state.get("last_offset", 0) > self.log_file.stat().st_size:
+            return fresh
+        return state
+
+    def _save_rollup(self, state: dict):
+        """Atomically replace the rollup file"""
+        tmp_file = self.rollup_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, self.rollup_file)
+
     def get_summary(self, days: int = 30):
         """Get usage summary for last N days"""
         if not self.log_file.exists():
             return {"total_cost": 0, "total_tokens": 0, "requests": 0}
 
-        total_cost = 0
-        total_tokens = 0
-        requests = 0
-        by_task = {}
-        by_model = {}
-
-        with open(self.log_file, "r") as f:
+        state = self._load_rollup()
+        offset = state["last_offset"]
+        total_cost = state["total_cost"]
+        total_tokens = state["total_tokens"]
+        requests = state["requests"]
+        by_task = defaultdict(lambda: {"cost": 0, "tokens": 0, "count": 0}, state["by_task"])
+        by_model = defaultdict(lambda: {"cost": 0, "tokens": 0, "count": 0}, state["by_model"])
+
+        loads = _json.loads
+        with open(self.log_file, "rb", buffering=1 << 20) as f:
+            f.seek(offset)
             for line in f:
+                # Leave a partially written last line for the next call
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
                 try:
-                    entry = json.loads(line)
-                    total_cost += entry["cost"]
-                    total_tokens += entry["total_tokens"]
-                    requests += 1
-
-                    # By task
+                    entry = loads(line)
+                    cost = entry["cost"]
+                    tokens = entry["total_tokens"]
                     task = entry["task"]
-                    if task not in by_task:
-                        by_task[task] = {"cost": 0, "tokens": 0, "count": 0}
-                    by_task[task]["cost"] += entry["cost"]
-                    by_task[task]["tokens"] += entry["total_tokens"]
-                    by_task[task]["count"] += 1
-
-                    # By model
                     model = entry["model_type"]
-                    if model not in by_model:
-                        by_model[model] = {"cost": 0, "tokens": 0, "count": 0}
-                    by_model[model]["cost"] += entry["cost"]
-                    by_model[model]["tokens"] += entry["total_tokens"]
-                    by_model[model]["count"] += 1
-
-                except:
+                except (ValueError, KeyError, TypeError):
+                    # Skip corrupt or incomplete entries
                     continue
 
-        return {
+                total_cost += cost
+                total_tokens += tokens
+                requests += 1
+
+                # By task
+                stats = by_task[task]
+                stats["cost"] += cost
+                stats["tokens"] += tokens
+                stats["count"] += 1
+
+                # By model
+                stats = by_model[model]
+                stats["cost"] += cost
+                stats["tokens"] += tokens
+                stats["count"] += 1
+
+        summary = {
             "total_cost": total_cost,
             "total_tokens": total_tokens,
             "requests": requests,
-            "by_task": by_task,
-            "by_model": by_model
+            "by_task": dict(by_task),
+            "by_model": dict(by_model)
         }
 
+        if offset != state["last_offset"]:
+            try:
+                self._save_rollup({"last_offset": offset, **summary})
+            except OSError:
+                pass
+
+        return summary
+
     def print_summary(self):
         """Print formatted summary"""
         summary = self.get_summary()
@@ -1,9 +1,71 @@
 import streamlit as st
-import glob
+import mmap
 import os
+import re
+from itertools import islice
 
 st.set_page_config(page_title="Log File Viewer", layout="wide")
 
+# Only the tail of large files is shown, and search results are capped,
+# so memory use stays bounded regardless of log size
+MAX_DISPLAY_BYTES = 256 * 1024
+MAX_MATCHES = 5000
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def search_log(path, mtime, search_term, count_all=False):
+    """Return (matching lines, hit the cap, total count or None) for a search.
+
+    mtime is part of the cache key so edits to the file invalidate results.
+    """
+    # One case-insensitive regex scan over the raw bytes finds each hit; the
+    # surrounding line is then sliced out without splitting the whole file.
+    # IGNORECASE on bytes only folds ASCII, which covers log text.
+    pattern = re.compile(re.escape(search_term.encode('utf-8')), re.IGNORECASE)
+    total_matches = None
+
+    def matching(buf):
+        pos = 0
+        while True:
+            m = pattern.search(buf, pos)
+            if m is None:
+                return
+            start = buf.rfind(b'\n', 0, m.start()) + 1
+            end = buf.find(b'\n', m.end())
+            if end == -1:
+                end = len(buf)
+            yield buf[start:end]
+            # Resume after this line so it is reported once
+            pos = end + 1
+
+    # Map the file read-only so the scan works straight off the page cache
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        matches = matching(mm)
+        head = list(islice(matches, MAX_MATCHES))
+        capped = len(head) == MAX_MATCHES and next(matches, None) is not None
+
+        # Only walk the rest of the file when asked to
+        if capped and count_all:
+            total_matches = MAX_MATCHES + 1 + sum(1 for _ in matches)
+
+    matching_lines = [line.rstrip(b'\r\n').decode('utf-8', 'replace') for line in head]
+    return matching_lines, capped, total_matches
+
+
+@st.cache_data(ttl=5)
+def find_changes_files(dir_mtime):
+    """List dept_changes_*.txt files in the working directory, newest first.
+
+    dir_mtime is part of the cache key so added or removed files show up.
+    """
+    names = [
+        entry.name for entry in os.scandir('.')
+        if entry.name.startswith('dept_changes_') and entry.name.endswith('.txt') and entry.is_file()
+    ]
+    names.sort(reverse=True)
+    return names
+
+
 st.title("📋 Log File Viewer")
 
 # Find log files
@@ -12,7 +74,7 @@ if os.path.exists("department_organizer.log"):
     log_files.append("department_organizer.log")
 
 # Find file_changes files
-changes_files = sorted(glob.glob("dept_changes_*.txt"), reverse=True)
+changes_files = find_changes_files(os.stat('.').st_mtime)
 log_files.extend(changes_files)
 
 if not log_files:
@@ -36,33 +98,53 @@ else:
 
         st.divider()
 
+        if file_size == 0:
+            st.info("File is empty")
+            st.stop()
+
         # Read and display file content
         try:
-            with open(selected_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Add search functionality
-            search_term = st.text_input("🔍 Search in file:", "")
-
-            if search_term:
-                lines = content.split('\n')
-                matching_lines = [line for line in lines if search_term.lower() in line.lower()]
-                st.info(f"Found {len(matching_lines)} matching lines")
-                content_to_display = '\n'.join(matching_lines)
-            else:
-                content_to_display = content
-
-            # Display content
-            st.subheader(f"📄 {selected_file}")
-            st.text_area("File Content", content_to_display, height=600, disabled=True)
-
-            # Download button
-            st.download_button(
-                label="⬇️ Download File",
-                data=content,
-                file_name=selected_file,
-                mime="text/plain"
-            )
+            # Add search functionality; the form only reruns the search on submit
+            with st.form("search"):
+                search_term = st.text_input("🔍 Search in file:", "")
+                st.form_submit_button("Search")
+
+            # Map the file once per rerun; the tail view and the download
+            # payload are both sliced from this read-only mapping, and the
+            # full-file payload is only built when a download is requested
+            with open(selected_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if search_term:
+                    matching_lines, capped, total_matches = search_log(selected_file, file_modified, search_term)
+                    if capped and st.button("Count all matches"):
+                        matching_lines, capped, total_matches = search_log(
+                            selected_file, file_modified, search_term, count_all=True
+                        )
+
+                    if total_matches is not None:
+                        st.info(f"Found {total_matches:,} matching lines (showing first {MAX_MATCHES:,})")
+                    elif capped:
+                        st.info(f"Showing first {MAX_MATCHES:,} matching lines")
+                    else:
+                        st.info(f"Found {len(matching_lines)} matching lines")
+                    content_to_display = '\n'.join(matching_lines)
+                else:
+                    # Slice the tail straight out of the mapping
+                    if file_size > MAX_DISPLAY_BYTES:
+                        st.info(f"Showing last {MAX_DISPLAY_BYTES // 1024} KB of file")
+                    content_to_display = mm[-MAX_DISPLAY_BYTES:].decode('utf-8', 'replace')
+
+                # Display content
+                st.subheader(f"📄 {selected_file}")
+                st.text_area("File Content", content_to_display, height=600, disabled=True)
+
+                # Download button gets the raw bytes; no decode/re-encode round trip
+                if st.button("📦 Prepare download"):
+                    st.download_button(
+                        label="⬇️ Download File",
+                        data=mm[:],
+                        file_name=selected_file,
+                        mime="text/plain"
+                    )
 
         except Exception as e:
             st.error(f"Error reading file: {e}")
@@ -10,13 +10,16 @@ import json
 from pathlib import Path
 from datetime import datetime, timedelta
 import pandas as pd
-from collections import Counter
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 # Add API-Integration to path
 sys.path.insert(0, str(Path.home() / "Downloads" / "Resources" / "CH16_Technology" / "API-Integration"))
 
 try:
+    import httpx
     from supabase import create_client
 except ImportError:
     st.error("❌ Supabase library not installed. Run: pip3 install supabase")
@@ -30,6 +33,23 @@ st.set_page_config(
 
 # ===== SUPABASE CONNECTION =====
 
+def _keepalive_session(client):
+    """Swap the PostgREST session for a pooled keep-alive (HTTP/2 when available) client"""
+    old = client.postgrest.session
+    options = dict(
+        base_url=old.base_url,
+        headers=old.headers,
+        timeout=old.timeout,
+        limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=300),
+    )
+    try:
+        session = httpx.Client(http2=True, **options)
+    except ImportError:
+        # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+        session = httpx.Client(**options)
+    client.postgrest.session = session
+    old.close()
+
 @st.cache_resource
 def init_supabase():
     """Initialize Supabase client with credentials"""
@@ -46,57 +66,52 @@ def init_supabase():
 
     try:
         client = create_client(url, key)
-        # Test connection
-        client.table('file_metadata').select('file_id', count='exact').limit(1).execute()
+        _keepalive_session(client)
+        # Test connection (single-row read; count='exact' would force a COUNT(*))
+        client.table('file_metadata').select('file_id').limit(1).execute()
         return client, None
     except Exception as e:
         return None, str(e)
 
 # ===== DATA QUERIES =====
 
-@st.cache_data(ttl=60)
+# file_metadata changes rarely; stats are kept for a day and refreshed from the sidebar
+@st.cache_data(ttl=24*60*60, max_entries=32)
 def get_statistics(_client):
     """Get file system statistics from Supabase"""
     try:
-        # Total files
-        total_response = _client.table('file_metadata').select('file_id', count='exact').execute()
-        total = total_response.count if hasattr(total_response, 'count') else len(total_response.data)
+        # The three RPCs are independent; run them concurrently so the
+        # panel waits for the slowest round-trip rather than the sum
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            para_future = executor.submit(
+                lambda: _client.table('mv_file_stats').select('total, compliant, size_mb, para').single().execute()
+            )
+            dept_future = executor.submit(lambda: _client.rpc('dept_top_n', {'n': 20}).execute())
+            type_future = executor.submit(lambda: _client.rpc('filetype_top_n', {'n': 10}).execute())
+
+        # Total files, PARA breakdown, naming compliance and size (precomputed view)
+        para_summary = para_future.result().data
+        total = para_summary['total']
+        compliant = para_summary['compliant']
+        total_size_mb = float(para_summary['size_mb'])
 
         # By PARA
-        para_stats = {}
-        for para in ['Projects', 'Areas', 'Resources', 'Archive']:
-            response = _client.table('file_metadata').select('file_id', count='exact').eq('para_category', para).execute()
-            count = response.count if hasattr(response, 'count') else len(response.data)
-            para_stats[para] = count
-
-        # By department
-        dept_response = _client.table('file_metadata').select('dept_code, dept_name').execute()
-        dept_counter = Counter()
-        for file in dept_response.data:
-            dept = file.get('dept_code', 'Unknown')
-            dept_name = file.get('dept_name', '')
-            dept_counter[f"{dept} - {dept_name}"] += 1
-
-        # Naming compliance
-        compliant_response = _client.table('file_metadata').select('file_id', count='exact').eq('naming_compliant', True).execute()
-        compliant = compliant_response.count if hasattr(compliant_response, 'count') else len(compliant_response.data)
-
-        # File types
-        type_response = _client.table('file_metadata').select('file_type_category').execute()
-        type_counter = Counter()
-        for file in type_response.data:
-            ftype = file.get('file_type_category', 'Unknown')
-            type_counter[ftype] += 1
-
-        # Total size
-        size_response = _client.table('file_metadata').select('size_mb').execute()
-        total_size_mb = sum(f.get('size_mb', 0) for f in size_response.data if f.get('size_mb'))
+        para_stats = {
+            para: para_summary['para'].get(para, 0)
+            for para in ['Projects', 'Areas', 'Resources', 'Archive']
+        }
+
+        # By department (grouped server-side)
+        dept_distribution = [(row['label'], row['cnt']) for row in dept_future.result().data]
+
+        # File types (grouped server-side)
+        type_distribution = [(row['label'], row['cnt']) for row in type_future.result().data]
 
         return {
             'total_files': total,
             'para_distribution': para_stats,
-            'dept_distribution': dept_counter.most_common(20),
-            'file_type_distribution': type_counter.most_common(10),
+            'dept_distribution': dept_distribution,
+            'file_type_distribution': type_distribution,
             'naming_compliant': compliant,
             'compliance_rate': (compliant/total*100) if total > 0 else 0,
             'total_size_mb': total_size_mb,
@@ -106,13 +121,23 @@ def get_statistics(_client):
         st.error(f"Error fetching statistics: {e}")
         return None
 
+@st.cache_data(ttl=3600)
+def get_department_list(_client):
+    """Get department codes for the department selector"""
+    try:
+        response = _client.rpc('list_departments').execute()
+        return [row['dept_code'] for row in response.data]
+    except Exception as e:
+        st.error(f"Department list error: {e}")
+        return []
+
 @st.cache_data(ttl=30)
 def search_files(_client, search_term, limit=50):
-    """Search files by text"""
+    """Search files by text (websearch syntax against the search_tsv GIN index)"""
     try:
         response = _client.table('file_metadata')\
             .select('file_id, filename, dept_code, dept_name, para_category, company, size_mb, modified_date, file_path')\
-            .ilike('search_text', f'%{search_term.lower()}%')\
+            .filter('search_tsv', 'wfts(simple)', search_term)\
             .order('modified_date', desc=True)\
             .limit(limit)\
             .execute()
@@ -151,35 +176,14 @@ def get_files_by_para(_client, para_category, limit=100):
         st.error(f"PARA query error: {e}")
         return []
 
-@st.cache_data(ttl=60)
+# cache_resource hands every session the same list without pickling it;
+# callers must treat the result as read-only (copy before modifying)
+@st.cache_resource(ttl=60)
 def get_duplicates(_client):
     """Find duplicate files"""
     try:
-        response = _client.table('file_metadata')\
-            .select('content_hash, filename, file_path, size_mb, file_id')\
-            .execute()
-
-        # Group by hash
-        hash_map = {}
-        for file in response.data:
-            if file['content_hash']:
-                h = file['content_hash']
-                if h not in hash_map:
-                    hash_map[h] = []
-                hash_map[h].append(file)
-
-        # Return only duplicates
-        duplicates = []
-        for h, files in hash_map.items():
-            if len(files) > 1:
-                duplicates.append({
-                    'hash': h,
-                    'count': len(files),
-                    'total_size_mb': sum(f.get('size_mb', 0) for f in files),
-                    'files': files
-                })
-
-        return sorted(duplicates, key=lambda x: x['total_size_mb'], reverse=True)
+        # Grouping happens in Postgres; only duplicate groups come back
+        return _client.rpc('find_duplicates').execute().data
     except Exception as e:
         st.error(f"Duplicate query error: {e}")
         return []
@@ -216,6 +220,18 @@ def get_recent_files(_client, days=7, limit=50):
         st.error(f"Recent files error: {e}")
         return []
 
+# ===== EXPORT =====
+
+def results_to_csv(results):
+    """Encode PostgREST rows as CSV bytes with Arrow's writer (much faster than DataFrame.to_csv)"""
+    try:
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(pa.Table.from_pylist(results), buffer)
+        return buffer.getvalue().to_pybytes()
+    except pa.ArrowException:
+        # Mixed-type columns Arrow can't infer; fall back to pandas
+        return pd.DataFrame(results).to_csv(index=False).encode('utf-8')
+
 # ===== MAIN APP =====
 
 def main():
@@ -244,6 +260,14 @@ def main():
         help="Choose how to find files"
     )
 
+    if st.sidebar.button("🔄 Refresh stats"):
+        # mv_file_stats is otherwise only refreshed every 5 minutes by pg_cron
+        try:
+            client.rpc('refresh_file_stats').execute()
+        except Exception as e:
+            st.sidebar.warning(f"Stats view refresh failed, showing the last scheduled refresh: {e}")
+        get_statistics.clear()
+
     # ===== MAIN CONTENT BASED ON SEARCH MODE =====
 
     if search_mode == "Quick Stats":
@@ -316,8 +340,11 @@ def main():
     elif search_mode == "Text Search":
         st.header("🔎 Full-Text Search")
 
-        search_term = st.text_input("Search for files", placeholder="e.g., custody, police report, contract")
-        search_limit = st.slider("Max results", 10, 200, 50)
+        # Form widgets only report new values on submit, so typing doesn't rerun the query
+        with st.form("search"):
+            search_term = st.text_input("Search for files", placeholder="e.g., custody, police report, contract")
+            search_limit = st.slider("Max results", 10, 200, 50)
+            st.form_submit_button("Search")
 
         if search_term:
             with st.spinner(f"Searching for '{search_term}'..."):
@@ -326,26 +353,24 @@ def main():
             if results:
                 st.success(f"Found {len(results)} files matching '{search_term}'")
 
-                # Display results
-                for i, file in enumerate(results, 1):
-                    with st.expander(f"{i}. {file['filename']} ({file['size_mb']:.2f} MB)"):
-                        col1, col2 = st.columns(2)
-
-                        with col1:
-                            st.write(f"**UUID:** `{file['file_id']}`")
-                            st.write(f"**Department:** {file['dept_code']} - {file.get('dept_name', 'N/A')}")
-                            st.write(f"**PARA:** {file['para_category']}")
-                            st.write(f"**Company:** {file.get('company', 'N/A')}")
+                # Display results as one table; every detail field gets its own column
+                df = pd.DataFrame.from_records(results)
+                table = pd.DataFrame({
+                    'Filename': df['filename'],
+                    'UUID': df['file_id'],
+                    'Department': df['dept_code'].fillna('N/A') + ' - ' + df['dept_name'].fillna('N/A'),
+                    'PARA': df['para_category'].fillna('N/A'),
+                    'Company': df['company'].fillna('N/A'),
+                    'Size (MB)': df['size_mb'].fillna(0).round(2),
+                    'Modified': df['modified_date'].fillna('N/A'),
+                    'Path': df['file_path']
+                })
 
-                        with col2:
-                            st.write(f"**Modified:** {file['modified_date']}")
-                            st.write(f"**Size:** {file['size_mb']:.2f} MB")
-                            st.write(f"**Path:** `{file['file_path']}`")
+                st.dataframe(table, use_container_width=True, hide_index=True)
 
                 # Export option
                 if st.button("📥 Export Results to CSV"):
-                    df = pd.DataFrame(results)
-                    csv = df.to_csv(index=False)
+                    csv = results_to_csv(results)
                     st.download_button(
                         label="Download CSV",
                         data=csv,
@@ -409,8 +434,7 @@ def main():
         st.header("🏢 Files by Department")
 
         # Get all departments
-        stats = get_statistics(client)
-        dept_list = [dept.split(' - ')[0] for dept, _ in stats['dept_distribution']]
+        dept_list = get_department_list(client)
 
         dept_code = st.selectbox("Select Department", dept_list)
         dept_limit = st.slider("Max results", 10, 200, 100)
@@ -422,43 +446,43 @@ def main():
             if results:
                 st.success(f"Found {len(results)} files in {dept_code}")
 
+                # One DataFrame feeds both the metrics and the table
+                df = pd.DataFrame.from_records(results)
+
                 # Summary metrics
                 col1, col2, col3 = st.columns(3)
 
                 with col1:
-                    total_size = sum(f.get('size_mb', 0) for f in results)
+                    total_size = df['size_mb'].sum()
                     st.metric("Total Size", f"{total_size:.1f} MB")
 
                 with col2:
-                    compliant = sum(1 for f in results if f.get('naming_compliant'))
-                    compliance_pct = (compliant / len(results) * 100) if results else 0
+                    compliant = df['naming_compliant'].eq(True).sum()
+                    compliance_pct = compliant / len(df) * 100
                     st.metric("Naming Compliance", f"{compliance_pct:.1f}%")
 
                 with col3:
-                    para_counter = Counter(f['para_category'] for f in results if f.get('para_category'))
-                    most_common_para = para_counter.most_common(1)[0][0] if para_counter else 'N/A'
+                    para_counts = df['para_category'].value_counts()
+                    most_common_para = para_counts.index[0] if not para_counts.empty else 'N/A'
                     st.metric("Most Common PARA", most_common_para)
 
                 st.markdown("---")
 
                 # Display results table
-                df_data = []
-                for f in results:
-                    df_data.append({
-                        'Filename': f['filename'],
-                        'UUID': f['file_id'][:13] + '...',
-                        'PARA': f.get('para_category', 'N/A'),
-                        'Size (MB)': f'{f.get("size_mb", 0):.2f}',
-                        'Modified': f.get('modified_date', 'N/A')[:10],
-                        'Compliant': '✅' if f.get('naming_compliant') else '❌'
-                    })
+                table = pd.DataFrame({
+                    'Filename': df['filename'],
+                    'UUID': df['file_id'].str.slice(0, 13) + '...',
+                    'PARA': df['para_category'].fillna('N/A'),
+                    'Size (MB)': df['size_mb'].fillna(0).round(2),
+                    'Modified': df['modified_date'].fillna('N/A').str.slice(0, 10),
+                    'Compliant': df['naming_compliant'].map({True: '✅'}).fillna('❌')
+                })
 
-                st.dataframe(pd.DataFrame(df_data), use_container_width=True, hide_index=True)
+                st.dataframe(table, use_container_width=True, hide_index=True)
 
                 # Export option
                 if st.button("📥 Export to CSV"):
-                    df = pd.DataFrame(results)
-                    csv = df.to_csv(index=False)
+                    csv = results_to_csv(results)
                     st.download_button(
                         label="Download CSV",
                         data=csv,
@@ -480,43 +504,42 @@ def main():
         if results:
             st.success(f"Found {len(results)} files in {para_category}")
 
+            # One DataFrame feeds both the metrics and the table
+            df = pd.DataFrame.from_records(results)
+
             # Summary metrics
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                total_size = sum(f.get('size_mb', 0) for f in results)
+                total_size = df['size_mb'].sum()
                 st.metric("Total Size", f"{total_size:.1f} MB")
 
             with col2:
-                dept_counter = Counter(f.get('dept_code') for f in results if f.get('dept_code'))
-                unique_depts = len(dept_counter)
+                unique_depts = df['dept_code'].nunique()
                 st.metric("Unique Departments", unique_depts)
 
             with col3:
-                type_counter = Counter(f.get('file_type_category') for f in results if f.get('file_type_category'))
-                most_common_type = type_counter.most_common(1)[0][0] if type_counter else 'N/A'
+                type_counts = df['file_type_category'].value_counts()
+                most_common_type = type_counts.index[0] if not type_counts.empty else 'N/A'
                 st.metric("Most Common Type", most_common_type)
 
             st.markdown("---")
 
             # Display results table
-            df_data = []
-            for f in results:
-                df_data.append({
-                    'Filename': f['filename'],
-                    'UUID': f['file_id'][:13] + '...',
-                    'Department': f.get('dept_code', 'N/A'),
-                    'Type': f.get('file_type_category', 'N/A'),
-                    'Size (MB)': f'{f.get("size_mb", 0):.2f}',
-                    'Modified': f.get('modified_date', 'N/A')[:10]
-                })
+            table = pd.DataFrame({
+                'Filename': df['filename'],
+                'UUID': df['file_id'].str.slice(0, 13) + '...',
+                'Department': df['dept_code'].fillna('N/A'),
+                'Type': df['file_type_category'].fillna('N/A'),
+                'Size (MB)': df['size_mb'].fillna(0).round(2),
+                'Modified': df['modified_date'].fillna('N/A').str.slice(0, 10)
+            })
 
-            st.dataframe(pd.DataFrame(df_data), use_container_width=True, hide_index=True)
+            st.dataframe(table, use_container_width=True, hide_index=True)
 
             # Export option
             if st.button("📥 Export to CSV"):
-                df = pd.DataFrame(results)
-                csv = df.to_csv(index=False)
+                csv = results_to_csv(results)
                 st.download_button(
                     label="Download CSV",
                     data=csv,
@@ -539,18 +562,17 @@ def main():
             st.success(f"Found {len(results)} files modified in last {days} days")
 
             # Display results
-            df_data = []
-            for f in results:
-                df_data.append({
-                    'Filename': f['filename'],
-                    'UUID': f['file_id'][:13] + '...',
-                    'Department': f.get('dept_code', 'N/A'),
-                    'PARA': f.get('para_category', 'N/A'),
-                    'Size (MB)': f'{f.get("size_mb", 0):.2f}',
-                    'Modified': f.get('modified_date', 'N/A')
-                })
-
-            st.dataframe(pd.DataFrame(df_data), use_container_width=True, hide_index=True)
+            df = pd.DataFrame.from_records(results)
+            table = pd.DataFrame({
+                'Filename': df['filename'],
+                'UUID': df['file_id'].str.slice(0, 13) + '...',
+                'Department': df['dept_code'].fillna('N/A'),
+                'PARA': df['para_category'].fillna('N/A'),
+                'Size (MB)': df['size_mb'].fillna(0).round(2),
+                'Modified': df['modified_date'].fillna('N/A')
+            })
+
+            st.dataframe(table, use_container_width=True, hide_index=True)
         else:
             st.warning(f"No files modified in last {days} days")
 
@@ -561,22 +583,25 @@ def main():
             duplicates = get_duplicates(client)
 
         if duplicates:
-            st.warning(f"⚠️ Found {len(duplicates)} duplicate groups")
+            # Totals cover every duplicate group, not just the ones returned
+            totals = duplicates[0]
+            total_groups = totals['total_groups']
 
-            # Calculate total wasted space
-            total_wasted_mb = sum(dup['total_size_mb'] - (dup['total_size_mb'] / dup['count']) for dup in duplicates)
+            st.warning(f"⚠️ Found {total_groups} duplicate groups")
 
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                st.metric("Duplicate Groups", len(duplicates))
+                st.metric("Duplicate Groups", total_groups)
 
             with col2:
-                total_dup_files = sum(dup['count'] for dup in duplicates)
-                st.metric("Total Duplicate Files", total_dup_files)
+                st.metric("Total Duplicate Files", totals['total_files'])
 
             with col3:
-                st.metric("Wasted Space", f"{total_wasted_mb:.1f} MB")
+                st.metric("Wasted Space", f"{totals['total_wasted_mb']:.1f} MB")
+
+            if total_groups > len(duplicates):
+                st.caption(f"Showing the {len(duplicates)} largest groups of {total_groups}")
 
             st.markdown("---")
 
@@ -584,7 +609,7 @@ def main():
             for i, dup in enumerate(duplicates, 1):
                 with st.expander(f"Group {i}: {dup['count']} copies ({dup['total_size_mb']:.2f} MB total)"):
                     st.write(f"**Content Hash:** `{dup['hash'][:16]}...`")
-                    st.write(f"**Can save:** {dup['total_size_mb'] - (dup['total_size_mb'] / dup['count']):.2f} MB by keeping 1 copy")
+                    st.write(f"**Can save:** {dup['wasted_mb']:.2f} MB by keeping 1 copy")
 
                     st.write("**Files:**")
                     for file in dup['files']:
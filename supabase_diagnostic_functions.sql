@@ -0,0 +1,51 @@
+-- ============================================================================
+-- SUPABASE DATA DIAGNOSTIC FUNCTIONS
+-- Purpose: Server-side helpers for supabase_data_diagnostic.py
+-- ============================================================================
+
+-- Function: Row counts for a list of tables in one call
+-- Called as: supabase.rpc('table_row_counts', {'tables': [...], 'estimate_above': 10000})
+-- Tables that do not exist come back with a NULL row_count. Like PostgREST's
+-- Prefer: count=estimated, tables whose planner estimate (pg_class.reltuples)
+-- is at least estimate_above return that estimate instead of a COUNT(*) scan;
+-- smaller tables (and all tables when estimate_above is NULL) are counted exactly.
+DROP FUNCTION IF EXISTS table_row_counts(TEXT[]);
+
+CREATE OR REPLACE FUNCTION table_row_counts(tables TEXT[], estimate_above BIGINT DEFAULT NULL)
+RETURNS TABLE(table_name TEXT, row_count BIGINT, estimated BOOLEAN) AS $$
+DECLARE
+    t TEXT;
+    rel REGCLASS;
+    approx BIGINT;
+BEGIN
+    FOREACH t IN ARRAY tables LOOP
+        table_name := t;
+        estimated := FALSE;
+        rel := to_regclass(format('public.%I', t));
+        IF rel IS NULL THEN
+            row_count := NULL;
+        ELSE
+            SELECT reltuples::BIGINT INTO approx FROM pg_class WHERE oid = rel;
+            IF estimate_above IS NOT NULL AND approx >= estimate_above THEN
+                row_count := approx;
+                estimated := TRUE;
+            ELSE
+                EXECUTE format('SELECT COUNT(*) FROM %s', rel) INTO row_count;
+            END IF;
+        END IF;
+        RETURN NEXT;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+/*
+Run this SQL in the Supabase SQL Editor before deploying
+supabase_data_diagnostic.py. The function runs with the caller's
+privileges, so row-level security applies exactly as it did for the
+per-table count queries it replaces. Estimated counts come from planner
+statistics and ignore row-level security; they are only used for large
+tables, where the diagnostic just needs an order of magnitude.
+*/
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the API cost estimators in scripts/track_api_usage.py
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from track_api_usage import PRICING_MODELS, estimate_cost, estimate_cost_batch
+
+class TestEstimateCostBatch(unittest.TestCase):
+    """estimate_cost_batch must agree with the scalar estimate_cost"""
+
+    def test_matches_scalar_estimate(self):
+        """Each batch entry equals estimate_cost's total for the same request"""
+        requests = [
+            (1000, 500, 0),
+            (0, 0, 1),
+            (250_000, 12_345, 2),
+            (42, 7, 0),
+        ]
+        input_tokens, output_tokens, model_indices = zip(*requests)
+
+        costs = estimate_cost_batch(input_tokens, output_tokens, model_indices)
+
+        self.assertEqual(len(costs), len(requests))
+        for cost, (inp, out, idx) in zip(costs, requests):
+            expected = estimate_cost(inp, out, PRICING_MODELS[idx])["total_cost"]
+            self.assertAlmostEqual(float(cost), expected, places=12)
+
+if __name__ == "__main__":
+    unittest.main()
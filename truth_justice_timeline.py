@@ -11,6 +11,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import os
 from supabase import create_client
 import numpy as np
@@ -82,33 +83,31 @@ def calculate_truth_score(item_data):
 
     return max(0, min(100, score))
 
-def calculate_justice_score(truth_scores):
+def calculate_justice_score(timeline_df):
     """
     Calculate overall Justice Score from all truth scores
     Weighted average emphasizing critical items
+    Weights are built as whole columns with NumPy rather than per row
     """
-    if not truth_scores:
+    if timeline_df.empty:
         return 50  # Neutral
 
-    weights = []
-    scores = []
-
-    for item in truth_scores:
-        weight = 1.0
-
-        # Weight critical items more heavily
-        if item.get('importance') == 'CRITICAL':
-            weight = 3.0
-        elif item.get('importance') == 'HIGH':
-            weight = 2.0
-
-        # Weight court filings even more
-        if item.get('category') in ['MOTION', 'FILING', 'DECLARATION']:
-            weight *= 1.5
+    # Weight critical items more heavily
+    importance = timeline_df['importance']
+    weights = np.select(
+        [importance.eq('CRITICAL'), importance.eq('HIGH')],
+        [3.0, 2.0],
+        default=1.0
+    )
 
-        weights.append(weight)
-        scores.append(item.get('truth_score', 50))
+    # Weight court filings even more
+    weights = np.where(
+        timeline_df['category'].isin(['MOTION', 'FILING', 'DECLARATION']),
+        weights * 1.5,
+        weights
+    )
 
+    scores = timeline_df['truth_score'].fillna(50).to_numpy(dtype=float)
     weighted_score = np.average(scores, weights=weights)
     return round(weighted_score, 1)
 
@@ -122,8 +121,16 @@ def load_master_timeline():
     timeline_items = []
 
     try:
+        # The four source tables are independent; fetch them concurrently so
+        # the load takes one round-trip instead of four
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            events_future = executor.submit(supabase.table('court_events').select('*').execute)
+            docs_future = executor.submit(supabase.table('legal_documents').select('*').execute)
+            violations_future = executor.submit(supabase.table('legal_violations').select('*').execute)
+            comms_future = executor.submit(supabase.table('communications_matrix').select('*').execute)
+
         # 1. Court Events
-        events = supabase.table('court_events').select('*').execute()
+        events = events_future.result()
         for event in events.data:
             truth_data = {
                 'has_supporting_evidence': bool(event.get('event_outcome')),
@@ -150,7 +157,7 @@ def load_master_timeline():
             })
 
         # 2. Legal Documents (Filings, Motions, Declarations)
-        docs = supabase.table('legal_documents').select('*').execute()
+        docs = docs_future.result()
         for doc in docs.data:
             truth_data = {
                 'fraud_score': doc.get('micro_number', 0),
@@ -176,7 +183,7 @@ def load_master_timeline():
             })
 
         # 3. Violations (Lies, False Statements, Perjury)
-        violations = supabase.table('legal_violations').select('*').execute()
+        violations = violations_future.result()
         for viol in violations.data:
             truth_data = {
                 'proven_false': True,  # Violations are proven falsehoods
@@ -203,7 +210,7 @@ def load_master_timeline():
 
         # 4. Communications (Statements made)
         try:
-            comms = supabase.table('communications_matrix').select('*').execute()
+            comms = comms_future.result()
             for comm in comms.data:
                 truth_data = {
                     'has_supporting_evidence': True,  # Communication is documented
@@ -263,7 +270,7 @@ st.header("🎯 Justice Score: Truth vs. Lies")
 col1, col2, col3, col4 = st.columns(4)
 
 # Calculate overall justice score
-justice_score = calculate_justice_score(timeline_df.to_dict('records'))
+justice_score = calculate_justice_score(timeline_df)
 
 # Count truth vs lies
 true_items = len(timeline_df[timeline_df['truth_score'] >= 75])